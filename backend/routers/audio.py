@@ -36,6 +36,16 @@ def _audio_file_path(block_id: str) -> str:
     return os.path.join(AUDIO_TMP_DIR, f"{block_id}.wav")
 
 
+def _write_audio_file(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _read_audio_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def _cleanup_audio_file(block_id: str):
     try:
         os.remove(_audio_file_path(block_id))
@@ -90,10 +100,11 @@ async def receive_audio_block(
     # Save audio to temp file for transcription and potential retrigger.
     # Ensure the dir exists here too: startup creates it, but /tmp can be
     # reaped while the backend is long-running (and tests skip the lifespan).
+    # The write runs in a worker thread so a multi-MB block never stalls the
+    # event loop (other sessions' requests, pipeline-status polling).
     os.makedirs(AUDIO_TMP_DIR, exist_ok=True)
     audio_path = _audio_file_path(block_id)
-    with open(audio_path, "wb") as f:
-        f.write(audio_data)
+    await asyncio.to_thread(_write_audio_file, audio_path, audio_data)
 
     # Register pipeline event
     state.pipeline_events[block_id] = {
@@ -144,8 +155,7 @@ async def process_audio_pipeline_async(block_id: str, audio_path: str, session_i
         # Step 1: Transcription (sync call wrapped for async)
         logger.info(f"[{block_id}] Step 1: Transcribing audio...")
         transcription_service = get_transcription_service()
-        with open(audio_path, "rb") as f:
-            audio_data = f.read()
+        audio_data = await asyncio.to_thread(_read_audio_file, audio_path)
         try:
             transcript, audio_duration = await asyncio.wait_for(
                 asyncio.to_thread(transcription_service.transcribe, audio_data, ep_keyterms),
@@ -167,6 +177,14 @@ async def process_audio_pipeline_async(block_id: str, audio_path: str, session_i
         if code is not None and audio_duration > 0:
             await db.increment_audio_seconds(code, int(round(audio_duration)))
 
+        # Silence gate: a block without any recognised speech has nothing to
+        # resolve or extract, so skip both LLM calls (the audio is still metered).
+        if not transcript.strip():
+            logger.info(f"[{block_id}] Empty transcript, skipping claim extraction")
+            _set_event_status(block_id, "done", "Keine Sprache erkannt", claim_count=0)
+            _cleanup_audio_file(block_id)
+            return
+
         # Grab previous transcript tail for cross-block context.
         # NOTE: two separate lock acquisitions are intentional — label resolution
         # runs outside the lock (it's a slow LLM call). In the rare case of truly
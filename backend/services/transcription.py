@@ -63,6 +63,9 @@ class TranscriptionService:
             for m in os.getenv("ASSEMBLYAI_SPEECH_MODELS", DEFAULT_SPEECH_MODELS).split(",")
             if m.strip()
         ]
+        # One Transcriber per service: each instance owns a thread pool, and the
+        # SDK's default client keeps the HTTP connection to AssemblyAI alive.
+        self.transcriber = aai.Transcriber()
 
         logger.info(f"TranscriptionService initialized (speech_models={self.speech_models})")
 
@@ -95,7 +98,7 @@ class TranscriptionService:
         logger.info(f"Starting transcription of {len(audio_data)} bytes ({len(keyterms or [])} keyterms)")
 
         # AssemblyAI SDK handles upload and polling automatically
-        transcript = aai.Transcriber().transcribe(audio_data, self._build_config(keyterms))
+        transcript = self.transcriber.transcribe(audio_data, self._build_config(keyterms))
         self._raise_on_error(transcript)
 
         formatted = self._format_transcript(transcript)
@@ -116,7 +119,7 @@ class TranscriptionService:
         """
         logger.info(f"Transcribing file: {file_path}")
 
-        transcript = aai.Transcriber().transcribe(file_path, self._build_config(keyterms))
+        transcript = self.transcriber.transcribe(file_path, self._build_config(keyterms))
         self._raise_on_error(transcript)
         return self._format_transcript(transcript), float(transcript.audio_duration or 0.0)
 
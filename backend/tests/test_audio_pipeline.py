@@ -214,3 +214,27 @@ async def test_pipeline_increments_audio_seconds_for_code(mock_audio_file):
         await process_audio_pipeline_async("inc-block", mock_audio_file, "inc-sess", "inc-code")
 
     assert (await state.get_db().get_code("inc-code"))["audio_seconds_used"] == 47
+
+
+async def test_empty_transcript_skips_claim_extraction(mock_audio_file):
+    """A block with no recognised speech is metered but never reaches the LLM steps."""
+    mock_transcription = MagicMock()
+    mock_transcription.transcribe = MagicMock(return_value=("  \n", 20.0))
+
+    mock_extractor = MagicMock()
+    mock_extractor.resolve_labels_async = AsyncMock()
+    mock_extractor.extract_claims_async = AsyncMock()
+
+    state.pipeline_events["silent-block"] = {"status": "processing"}
+    await state.get_db().add_code("silent-code", "ann")
+    await state.get_db().add_session({"session_id": "silent-sess", "title": "t", "guests": [], "context": ""})
+
+    with patch("backend.routers.audio.get_transcription_service", return_value=mock_transcription), \
+         patch("backend.routers.audio.get_claim_extractor", return_value=mock_extractor):
+        await process_audio_pipeline_async("silent-block", mock_audio_file, "silent-sess", "silent-code")
+
+    mock_extractor.resolve_labels_async.assert_not_called()
+    mock_extractor.extract_claims_async.assert_not_called()
+    assert state.pipeline_events["silent-block"]["status"] == "done"
+    assert state.pipeline_events["silent-block"]["claim_count"] == 0
+    assert (await state.get_db().get_code("silent-code"))["audio_seconds_used"] == 20
@@ -29,11 +29,11 @@ class TestKeytermsFromGuests:
 class TestTranscribeConfig:
     def _service_capturing_config(self, monkeypatch):
         monkeypatch.setenv("ASSEMBLYAI_API_KEY", "dummy")
-        captured = {}
+        captured = {"instances": 0}
 
         class FakeTranscriber:
             def __init__(self, *a, **k):
-                pass
+                captured["instances"] += 1
 
             def transcribe(self, audio, config=None):
                 captured["config"] = config
@@ -70,3 +70,9 @@ class TestTranscribeConfig:
         text, duration = svc.transcribe(b"audio")
         assert text == "ok"   # no utterances -> formatter falls back to transcript.text
         assert duration == 12.5
+
+    def test_reuses_one_transcriber_across_calls(self, monkeypatch):
+        svc, captured = self._service_capturing_config(monkeypatch)
+        svc.transcribe(b"audio")
+        svc.transcribe(b"audio")
+        assert captured["instances"] == 1
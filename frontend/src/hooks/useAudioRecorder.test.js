@@ -8,8 +8,9 @@ let recorders = []   // every MediaRecorder constructed during a test
 let tracks = []      // every track in the granted stream
 
 class FakeMediaRecorder {
-  constructor(stream) {
+  constructor(stream, options) {
     this.stream = stream
+    this.options = options
     this.state = 'inactive'
     this.ondataavailable = null
     this.onstop = null
@@ -57,12 +58,19 @@ describe('useAudioRecorder: start / error / stop', () => {
 
     await act(async () => { await result.current.start() })
 
-    expect(navigator.mediaDevices.getUserMedia).toHaveBeenCalledWith({ audio: true })
+    expect(navigator.mediaDevices.getUserMedia).toHaveBeenCalledWith({ audio: { channelCount: 1 } })
     expect(result.current.status).toBe('recording')
     expect(recorders).toHaveLength(1)
     expect(recorders[0].state).toBe('recording')
   })
 
+  it('records at a speech-grade bitrate', async () => {
+    const { result } = renderHook(() => useAudioRecorder('sess-1'))
+    await act(async () => { await result.current.start() })
+
+    expect(recorders[0].options).toEqual({ audioBitsPerSecond: 32000 })
+  })
+
   it('permission rejection sets status=error and never starts a recorder', async () => {
     installMediaMocks({ deny: true })
     const { result } = renderHook(() => useAudioRecorder('sess-1'))
@@ -24,6 +24,7 @@ Usage:
 
 import sys
 import os
+import json
 from datetime import datetime
 import requests
 
@@ -99,13 +100,20 @@ def read_text():
 def send_to_backend(text: str, headline: str, publication_date: str):
     """Send text, headline, and publication date to backend for claim extraction"""
     try:
-        response = requests.post(
-            TEXT_ENDPOINT,
-            json={
+        # Encode once as UTF-8: requests' json= escapes every umlaut to \uXXXX
+        # (6 bytes instead of 2), which adds up for long German articles.
+        payload = json.dumps(
+            {
                 'text': text,
                 'headline': headline,
                 'publication_date': publication_date
             },
+            ensure_ascii=False,
+        ).encode('utf-8')
+        response = requests.post(
+            TEXT_ENDPOINT,
+            data=payload,
+            headers={'Content-Type': 'application/json; charset=utf-8'},
             timeout=30
         )
 